@@ -0,0 +1,390 @@
+#!/usr/bin/env python3
+"""
+Consolidate per-dataset YAML metadata into a single JSON file.
+
+Reads every YAML file in docs/assets/dataset_info/ and writes
+docs/assets/info/consolidated_datasets.json (plus a gzipped copy) so the
+web app can fetch one file instead of hundreds of small ones.
+
+Usage:
+    python scripts/consolidate_metadata.py
+    python scripts/consolidate_metadata.py --input docs/assets/dataset_info --output docs/assets/info/consolidated_datasets.json
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import mmap
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import yaml
+
+# libyaml's C loader is ~10x faster than the pure-Python SafeLoader on
+# bulk loads; fall back gracefully when PyYAML was built without it.
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+# orjson serializes the consolidated dict several times faster than the
+# stdlib encoder and emits compact bytes directly.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# zstd beats gzip on both ratio and speed for this kind of repetitive
+# structured JSON; the .zst copy is optional and only written when the
+# zstandard package is installed.
+try:
+    import zstandard as zstd
+except ImportError:
+    zstd = None
+
+
+class TeeWriter:
+    """File-like object forwarding writes to several sinks at once."""
+
+    def __init__(self, *sinks):
+        self._sinks = sinks
+
+    def write(self, data):
+        for sink in self._sinks:
+            sink.write(data)
+        return len(data)
+
+
+def hash_yaml_file(file_path):
+    """Content hash of one file; orders of magnitude cheaper than parsing it."""
+    with open(file_path, 'rb') as f:
+        return hashlib.file_digest(f, 'blake2b').hexdigest()
+
+
+def load_cache(cache_file):
+    """Load the {stem: [hash, value]} sidecar from a previous run."""
+    try:
+        with open(cache_file, 'rb') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def load_yaml_file(file_path):
+    """Load a single YAML metadata file.
+
+    The file is memory-mapped and handed to libyaml as one buffer: a
+    single syscall instead of buffered read() chunks, and no
+    intermediate Python-level copy of the file contents.
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return yaml.load(mm, Loader=_Loader)
+    except Exception as e:
+        print(f"  Warning: failed to parse {file_path}: {e}", file=sys.stderr)
+        return None
+
+
+_resolver = yaml.resolver.Resolver()
+
+
+def _scalar_to_json(event):
+    """Render one YAML scalar event as JSON bytes."""
+    if event.style in (None, ''):
+        tag = _resolver.resolve(yaml.nodes.ScalarNode, event.value, event.implicit)
+        if tag.endswith(':null'):
+            return b'null'
+        if tag.endswith(':bool'):
+            return b'true' if event.value.lower() in ('true', 'yes', 'on') else b'false'
+        try:
+            if tag.endswith(':int'):
+                return str(int(event.value)).encode('ascii')
+            if tag.endswith(':float'):
+                return repr(float(event.value)).encode('ascii')
+        except ValueError:
+            pass
+    return json.dumps(event.value, ensure_ascii=False).encode('utf-8')
+
+
+def transcode_yaml_to_json(file_path, write):
+    """Stream one YAML file's token events straight to JSON bytes.
+
+    Walks the CSafeLoader event stream with a small state machine and
+    never materializes the intermediate Python dict, so neither the
+    object graph nor a second json.dump traversal is paid for.
+    """
+    # Each frame: ['m', first_item, expects_key] or ['s', first_item]
+    stack = []
+    seen_document = False
+
+    def open_value():
+        if stack and stack[-1][0] == 's':
+            if not stack[-1][1]:
+                write(b',')
+            stack[-1][1] = False
+
+    def close_value():
+        if stack and stack[-1][0] == 'm':
+            stack[-1][2] = True
+
+    with open(file_path, 'rb') as f:
+        for event in yaml.parse(f, Loader=_Loader):
+            if isinstance(event, yaml.ScalarEvent):
+                if stack and stack[-1][0] == 'm' and stack[-1][2]:
+                    frame = stack[-1]
+                    if not frame[1]:
+                        write(b',')
+                    frame[1] = False
+                    frame[2] = False
+                    write(json.dumps(event.value, ensure_ascii=False).encode('utf-8'))
+                    write(b':')
+                else:
+                    open_value()
+                    write(_scalar_to_json(event))
+                    close_value()
+            elif isinstance(event, yaml.MappingStartEvent):
+                open_value()
+                write(b'{')
+                stack.append(['m', True, True])
+            elif isinstance(event, yaml.MappingEndEvent):
+                stack.pop()
+                write(b'}')
+                close_value()
+            elif isinstance(event, yaml.SequenceStartEvent):
+                open_value()
+                write(b'[')
+                stack.append(['s', True])
+            elif isinstance(event, yaml.SequenceEndEvent):
+                stack.pop()
+                write(b']')
+                close_value()
+            elif isinstance(event, yaml.DocumentStartEvent):
+                # a second root value would concatenate into invalid JSON
+                if seen_document:
+                    raise ValueError(
+                        "multi-document YAML is not supported by the transcoder")
+                seen_document = True
+            elif isinstance(event, yaml.AliasEvent):
+                raise ValueError("anchors/aliases are not supported by the transcoder")
+
+
+def write_ndjson(consolidated, ndjson_file, gzip_level):
+    """Write one {key: metadata} record per line, gzip-compressed.
+
+    Newline-delimited records let a streaming client parse and render
+    datasets progressively instead of buffering the whole response.
+    """
+    with gzip.open(ndjson_file, 'wb', compresslevel=gzip_level) as f_gz:
+        for key, val in consolidated.items():
+            if orjson is not None:
+                f_gz.write(orjson.dumps({key: val}))
+            else:
+                f_gz.write(json.dumps({key: val}, ensure_ascii=False,
+                                      separators=(',', ':')).encode('utf-8'))
+            f_gz.write(b'\n')
+
+
+def consolidate_metadata(input_dir, output_file, gzip_level=6, zstd_level=15,
+                         ndjson=False, transcode=False):
+    """Merge all dataset YAML files into one JSON document keyed by stem."""
+    input_path = Path(input_dir)
+    if not input_path.is_dir():
+        print(f"Error: input directory not found: {input_path}", file=sys.stderr)
+        return False
+
+    # One scandir sweep picks up both suffixes; raw string paths skip
+    # per-entry Path allocation and stems come from a cheap rsplit.
+    with os.scandir(input_path) as it:
+        all_files = sorted(
+            (entry.name.rsplit('.', 1)[0], entry.path, entry.stat().st_mtime_ns)
+            for entry in it
+            if entry.is_file() and entry.name.endswith(('.yml', '.yaml'))
+        )
+    if not all_files:
+        print(f"Error: no YAML files found in {input_path}", file=sys.stderr)
+        return False
+
+    print(f"Consolidating {len(all_files)} YAML files from {input_path}...")
+    start = time.time()
+
+    if transcode:
+        # Fast path: stream YAML events straight into JSON bytes without
+        # building Python dicts (bypasses the parse cache by design).
+        # Outputs are written under temp names and renamed into place at
+        # the end, so a failure never clobbers the previous good files.
+        output_path = Path(output_file)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        compressed_file = Path(str(output_path) + ".gz")
+        tmp_plain = Path(str(output_path) + ".tmp")
+        tmp_gz = Path(str(compressed_file) + ".tmp")
+        n_written = 0
+        try:
+            with open(tmp_plain, 'wb') as f_plain, \
+                    gzip.open(tmp_gz, 'wb', compresslevel=gzip_level) as f_gz:
+                tee = TeeWriter(f_plain, f_gz)
+                tee.write(b'{')
+                for stem, path, _ in all_files:
+                    # buffer each entry so a mid-file failure emits
+                    # nothing: warn and skip, like the default path
+                    buf = bytearray()
+                    try:
+                        transcode_yaml_to_json(path, buf.extend)
+                    except (yaml.YAMLError, ValueError, OSError) as e:
+                        print(f"  Warning: failed to transcode {path}: {e}",
+                              file=sys.stderr)
+                        continue
+                    if not buf:
+                        # empty/comment-only file: no root value to emit,
+                        # dropped like the default path drops None parses
+                        continue
+                    if n_written:
+                        tee.write(b',')
+                    tee.write(json.dumps(stem).encode('utf-8'))
+                    tee.write(b':')
+                    tee.write(bytes(buf))
+                    n_written += 1
+                tee.write(b'}')
+        except BaseException:
+            tmp_plain.unlink(missing_ok=True)
+            tmp_gz.unlink(missing_ok=True)
+            raise
+        os.replace(tmp_plain, output_path)
+        os.replace(tmp_gz, compressed_file)
+        elapsed = time.time() - start
+        print(f"Done in {elapsed:.1f}s: {n_written} datasets (transcoded)")
+        print(f"  {output_path} ({output_path.stat().st_size / (1024 * 1024):.2f} MB)")
+        print(f"  {compressed_file} ({compressed_file.stat().st_size / (1024 * 1024):.2f} MB)")
+        return True
+
+    # Hash every file and reuse previously parsed values from the cache
+    # sidecar; only changed files go through libyaml. Hashing runs at
+    # GB/s, so incremental rebuilds become O(changed files).
+    output_path = Path(output_file)
+    # dot-prefixed so the deploy and the diagnostics index ignore it
+    cache_file = output_path.with_name('.' + output_path.stem + '.cache.json')
+    cache = load_cache(cache_file)
+    hashes = {}
+    to_parse = []
+    for stem, path, mtime_ns in all_files:
+        entry = cache.get(stem)
+        # Unchanged mtime short-circuits even the hash, so an untouched
+        # file costs zero reads; the hash still catches touched-but-equal
+        # files (and older two-element cache entries lack the mtime).
+        if entry and len(entry) == 3 and entry[1] == mtime_ns:
+            hashes[stem] = entry[0]
+            continue
+        digest = hash_yaml_file(path)
+        hashes[stem] = digest
+        if not (entry and entry[0] == digest):
+            to_parse.append((stem, path))
+
+    parsed = {}
+    if to_parse:
+        # YAML parsing is CPU-bound inside libyaml, so fan the files out
+        # across cores; chunking amortizes the per-task IPC overhead.
+        chunksize = max(1, len(to_parse) // (4 * (os.cpu_count() or 1)))
+        with ProcessPoolExecutor() as executor:
+            results = executor.map(load_yaml_file, [p for _, p in to_parse],
+                                   chunksize=chunksize)
+            for i, ((stem, _), data) in enumerate(zip(to_parse, results), 1):
+                parsed[stem] = data
+                if i % 100 == 0 or i == len(to_parse):
+                    print(f"  Parsed {i}/{len(to_parse)} changed files")
+
+    consolidated = {}
+    new_cache = {}
+    for stem, _, mtime_ns in all_files:
+        data = parsed[stem] if stem in parsed else cache[stem][-1]
+        if data is not None:
+            consolidated[stem] = data
+            new_cache[stem] = [hashes[stem], mtime_ns, data]
+    print(f"  Reused {len(all_files) - len(to_parse)} cached, "
+          f"parsed {len(to_parse)} files")
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Serialize once, feeding both the plain file and the .gz copy in the
+    # same pass; no full-file re-read is needed.
+    compressed_file = Path(str(output_path) + ".gz")
+    if orjson is not None:
+        json_bytes = orjson.dumps(consolidated)
+        output_path.write_bytes(json_bytes)
+        with gzip.open(compressed_file, 'wb', compresslevel=gzip_level) as f_gz:
+            f_gz.write(json_bytes)
+    else:
+        with open(output_path, 'w', encoding='utf-8') as f_plain, \
+                gzip.open(compressed_file, 'wt', encoding='utf-8', compresslevel=gzip_level) as f_gz:
+            json.dump(consolidated, TeeWriter(f_plain, f_gz),
+                      ensure_ascii=False, separators=(',', ':'))
+        json_bytes = None
+
+    # Also emit a .zst copy for servers/browsers that accept zstd; keep
+    # the .gz as the universal fallback.
+    zstd_file = None
+    if zstd is not None:
+        zstd_file = Path(str(output_path) + ".zst")
+        cctx = zstd.ZstdCompressor(level=zstd_level, threads=-1)
+        if json_bytes is None:
+            json_bytes = output_path.read_bytes()
+        zstd_file.write_bytes(cctx.compress(json_bytes))
+
+    if orjson is not None:
+        cache_file.write_bytes(orjson.dumps(new_cache))
+    else:
+        with open(cache_file, 'w', encoding='utf-8') as f:
+            json.dump(new_cache, f, ensure_ascii=False, separators=(',', ':'))
+
+    ndjson_file = None
+    if ndjson:
+        ndjson_file = Path(str(output_path).rsplit('.json', 1)[0] + ".ndjson.gz")
+        write_ndjson(consolidated, ndjson_file, gzip_level)
+
+    elapsed = time.time() - start
+    json_mb = output_path.stat().st_size / (1024 * 1024)
+    gz_mb = compressed_file.stat().st_size / (1024 * 1024)
+    print(f"Done in {elapsed:.1f}s: {len(consolidated)} datasets")
+    print(f"  {output_path} ({json_mb:.2f} MB)")
+    print(f"  {compressed_file} ({gz_mb:.2f} MB)")
+    if zstd_file is not None:
+        print(f"  {zstd_file} ({zstd_file.stat().st_size / (1024 * 1024):.2f} MB)")
+    if ndjson_file is not None:
+        print(f"  {ndjson_file} ({ndjson_file.stat().st_size / (1024 * 1024):.2f} MB)")
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Consolidate dataset YAML metadata into a single JSON file")
+    parser.add_argument('--input', default='docs/assets/dataset_info',
+                        help='Directory containing per-dataset YAML files')
+    parser.add_argument('--output', default='docs/assets/info/consolidated_datasets.json',
+                        help='Path of the consolidated JSON output')
+    parser.add_argument('--gzip-level', type=int, default=6, choices=range(1, 10),
+                        metavar='1-9',
+                        help='gzip compression level; 6 is 2-3x faster than 9 '
+                             'for only a few percent larger output (default: 6)')
+    parser.add_argument('--zstd-level', type=int, default=15,
+                        help='zstd compression level for the optional .zst copy '
+                             '(default: 15)')
+    parser.add_argument('--ndjson', action='store_true',
+                        help='also write a newline-delimited .ndjson.gz copy '
+                             'for streaming clients')
+    parser.add_argument('--transcode', action='store_true',
+                        help='stream YAML events straight to JSON without '
+                             'building Python dicts (skips the parse cache, '
+                             '.zst and NDJSON outputs)')
+    args = parser.parse_args()
+
+    ok = consolidate_metadata(args.input, args.output,
+                              gzip_level=args.gzip_level, zstd_level=args.zstd_level,
+                              ndjson=args.ndjson, transcode=args.transcode)
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
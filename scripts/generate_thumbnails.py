@@ -0,0 +1,401 @@
+#!/usr/bin/env python3
+"""
+Generate thumbnail images for the dataset preview videos.
+
+Extracts one frame per video from docs/assets/videos/ into
+docs/assets/thumbnails/ so the grid can show a lightweight JPEG instead
+of loading the video itself. Cuts initial page bandwidth dramatically
+for large dataset counts.
+
+Usage:
+    python scripts/generate_thumbnails.py
+    python scripts/generate_thumbnails.py --workers 8 --width 320
+"""
+
+import argparse
+import asyncio
+import concurrent.futures
+import os
+import shutil
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+try:  # optional: SIMD JPEG encode (libvips, or Pillow-SIMD/mozjpeg)
+    import pyvips
+except ImportError:
+    pyvips = None
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+
+def check_ffmpeg():
+    """Return True when ffmpeg is on PATH (pure lookup, no subprocess)."""
+    return shutil.which("ffmpeg") is not None
+
+
+def _timestamp_seconds(timestamp):
+    """Parse [HH:]MM:SS(.mmm) or plain seconds into a float."""
+    seconds = 0.0
+    for part in str(timestamp).split(':'):
+        seconds = seconds * 60 + float(part)
+    return seconds
+
+
+# Encoder arguments per output format. WebP is ~25-35% smaller than JPEG
+# at equal quality and AVIF roughly half, but the site currently resolves
+# thumbnails as <stem>.jpg (data-manager.js), so jpg stays the default.
+FORMAT_ARGS = {
+    'jpg': [],
+    'webp': ['-c:v', 'libwebp', '-quality', '80', '-preset', 'picture'],
+    'avif': ['-c:v', 'libaom-av1', '-still-picture', '1', '-crf', '30',
+             '-cpu-used', '6'],
+}
+
+
+_hwaccel_cache = None
+
+
+def _hwaccel_args():
+    """Input options enabling hardware decode, probed once per run.
+
+    `-hwaccel auto` lets ffmpeg pick NVDEC/VAAPI/VideoToolbox when one
+    is present and silently falls back to software; decoded frames stay
+    in system memory so the CPU scale filter keeps working. Returns []
+    when ffmpeg reports no usable accelerator.
+    """
+    global _hwaccel_cache
+    if _hwaccel_cache is None:
+        try:
+            result = subprocess.run(["ffmpeg", "-hide_banner", "-hwaccels"],
+                                    capture_output=True, text=True)
+            accels = {line.strip() for line in result.stdout.splitlines()[1:]}
+        except OSError:
+            accels = set()
+        if accels & {"cuda", "vaapi", "videotoolbox", "qsv", "d3d11va"}:
+            _hwaccel_cache = ["-hwaccel", "auto"]
+        else:
+            _hwaccel_cache = []
+    return _hwaccel_cache
+
+
+def nearest_keyframe(video_path, min_time=1.0, window=2):
+    """Return the first keyframe timestamp >= `min_time`, in seconds.
+
+    Seeking `-ss` before `-i` to an exact keyframe costs zero decoded
+    frames; a timestamp inside a GOP forces decoding from the previous
+    keyframe. One ffprobe pass over the first `window` seconds finds the
+    aligned timestamp. Falls back to `min_time` when probing fails.
+    """
+    # pts_time on ffmpeg >= 5.0; pkt_pts_time kept for older builds
+    # (requesting both is fine: unknown entries are simply absent)
+    cmd = ["ffprobe", "-v", "error", "-select_streams", "v:0",
+           "-skip_frame", "nokey", "-show_frames",
+           "-show_entries", "frame=pts_time,pkt_pts_time",
+           "-read_intervals", f"%+{window}", "-of", "csv=p=0",
+           str(video_path)]
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True)
+    except OSError:
+        return min_time
+    times = []
+    for line in result.stdout.splitlines():
+        # one value per line on >= 5.0, both fields on older builds
+        for field in line.split(','):
+            try:
+                times.append(float(field))
+            except ValueError:
+                continue
+            break
+    for t in times:
+        if t >= min_time:
+            return t
+    return times[-1] if times else min_time
+
+
+def _inprocess_encode(fmt):
+    """True when the frame should be piped out and encoded in-process."""
+    return fmt == 'jpg' and (pyvips is not None or Image is not None)
+
+
+def _thumbnail_cmd(video_path, output_path, timestamp, width, quality, fmt,
+                   raw_pipe=False):
+    """Build the ffmpeg command line for one thumbnail extraction."""
+    seconds = _timestamp_seconds(timestamp)
+    if seconds > 2.0:
+        coarse = seconds - 1.0
+        seek_args = ["-ss", f"{coarse:.3f}", "-noaccurate_seek",
+                     "-i", str(video_path), "-ss", "1.000"]
+    else:
+        seek_args = ["-ss", str(timestamp), "-i", str(video_path)]
+    cmd = [
+        "ffmpeg",
+        "-hide_banner", "-loglevel", "error",
+        # The videos are short clips with known layout; skip the default
+        # multi-second stream analysis that would dominate per-file cost.
+        # One decode thread per invocation: the pool already runs one
+        # process per core, so ffmpeg's auto-threading would oversubscribe.
+        "-threads", "1",
+        "-probesize", "32", "-analyzeduration", "0", "-fflags", "+fastseek",
+        *_hwaccel_args(),
+        *seek_args,
+        "-vframes", "1",
+        "-vf", f"scale={width}:-1",
+    ]
+    if raw_pipe:
+        cmd += ["-f", "rawvideo", "-pix_fmt", "rgb24", "-"]
+    else:
+        cmd += FORMAT_ARGS[fmt]
+        if fmt == 'jpg':
+            cmd += ["-q:v", str(quality)]
+        cmd += ["-y", str(output_path)]
+    return cmd
+
+
+def generate_thumbnail(video_path, output_path, timestamp="00:00:01", width=320,
+                       quality=2, fmt='jpg'):
+    """Extract a single frame from `video_path` into `output_path`.
+
+    Uses ffmpeg's two-stage seek for larger offsets: a coarse `-ss`
+    before `-i` jumps by keyframe without decoding, and a small `-ss`
+    after `-i` decodes only the last stretch to the exact frame. For
+    the default 1s offset a single input seek is already optimal.
+
+    When libvips or Pillow is importable, ffmpeg pipes the raw RGB frame
+    out and the JPEG is encoded in-process on the SIMD path; otherwise
+    ffmpeg's built-in libjpeg encoder is used.
+    """
+    if _inprocess_encode(fmt):
+        # Pipe the raw frame out and encode the JPEG in-process, where the
+        # encoder's vectorized colour conversion and DCT are available.
+        cmd = _thumbnail_cmd(video_path, output_path, timestamp, width,
+                             quality, fmt, raw_pipe=True)
+        result = subprocess.run(cmd, stdout=subprocess.PIPE,
+                                stderr=subprocess.DEVNULL)
+        raw = result.stdout
+        if result.returncode != 0 or len(raw) < width * 3:
+            return False
+        height = len(raw) // (width * 3)
+        if pyvips is not None:
+            im = pyvips.Image.new_from_memory(raw, width, height, 3, 'uchar')
+            im.jpegsave(str(output_path), Q=85, optimize_coding=True, strip=True)
+        else:
+            Image.frombytes('RGB', (width, height), raw).save(
+                str(output_path), format='JPEG', quality=85, optimize=True)
+        return True
+    cmd = _thumbnail_cmd(video_path, output_path, timestamp, width, quality, fmt)
+    result = subprocess.run(cmd, stdout=subprocess.DEVNULL,
+                            stderr=subprocess.DEVNULL)
+    return result.returncode == 0
+
+
+async def _run_ffmpeg_fleet(tasks, max_workers, report):
+    """Drive all ffmpeg processes from one event loop.
+
+    When ffmpeg does its own encoding there is no Python-side CPU work,
+    so a process pool only adds IPC; a semaphore-bounded asyncio fleet
+    keeps `max_workers` ffmpeg processes in flight from a single thread.
+    """
+    sem = asyncio.Semaphore(max_workers)
+    done = 0
+
+    async def run_one(task):
+        nonlocal done
+        video_file, thumb_path, timestamp, width, fmt = task
+        cmd = _thumbnail_cmd(video_file, thumb_path, timestamp, width, 2, fmt)
+        async with sem:
+            proc = await asyncio.create_subprocess_exec(
+                *cmd, stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL)
+            await proc.wait()
+        done += 1
+        report(done)
+        return video_file.name, proc.returncode == 0, thumb_path
+
+    return await asyncio.gather(*(run_one(task) for task in tasks))
+
+
+def generate_thumbnail_grid(video_path, timestamps, output_dir, width=320, quality=2, fps=30):
+    """Extract several frames from one video with a single ffmpeg call.
+
+    Looping `generate_thumbnail` pays fork+exec+probe once per frame; one
+    `select` filter amortises decoder setup across all of them. Frames are
+    written as `<stem>_%03d.jpg` in `output_dir`, one per timestamp.
+    """
+    frames = sorted({int(round(_timestamp_seconds(ts) * fps)) for ts in timestamps})
+    select_expr = "+".join(f"eq(n,{n})" for n in frames)
+    output_pattern = Path(output_dir) / (Path(video_path).stem + "_%03d.jpg")
+    cmd = [
+        "ffmpeg",
+        "-hide_banner", "-loglevel", "error",
+        "-probesize", "32", "-analyzeduration", "0", "-fflags", "+fastseek",
+        "-i", str(video_path),
+        "-vf", f"select='{select_expr}',scale={width}:-1",
+        "-vsync", "vfr",
+        "-frame_pts", "1",
+        "-q:v", str(quality),
+        "-y", str(output_pattern),
+    ]
+    result = subprocess.run(cmd, stdout=subprocess.DEVNULL,
+                            stderr=subprocess.DEVNULL)
+    return result.returncode == 0
+
+
+def _process_video(task):
+    """Worker entry point: generate one thumbnail, return its outcome."""
+    video_file, thumb_path, timestamp, width, fmt = task
+    ok = generate_thumbnail(video_file, thumb_path, timestamp=timestamp,
+                            width=width, fmt=fmt)
+    return video_file.name, ok, thumb_path
+
+
+def generate_all_thumbnails(videos_dir, output_dir, max_workers=None,
+                            timestamp="00:00:01", width=320, fmt='jpg',
+                            force=False, keyframe_seek=False, stems=None):
+    """Generate thumbnails for every video found in `videos_dir`."""
+    videos_path = Path(videos_dir)
+    output_path = Path(output_dir)
+    if not videos_path.is_dir():
+        print(f"Error: videos directory not found: {videos_path}", file=sys.stderr)
+        return False
+    output_path.mkdir(parents=True, exist_ok=True)
+
+    # One scandir pass instead of one glob per extension.
+    exts = ('.mp4', '.webm', '.avi', '.mov')
+    video_files = sorted(Path(entry.path) for entry in os.scandir(videos_path)
+                         if entry.is_file() and entry.name.lower().endswith(exts))
+    if stems is not None:
+        video_files = [f for f in video_files if f.stem in stems]
+    if not video_files:
+        print(f"Error: no videos found in {videos_path}", file=sys.stderr)
+        return False
+
+    tasks = []
+    skipped = 0
+    total_thumb_size = 0
+    video_sample_sizes = []
+    for video_file in video_files:
+        video_stat = video_file.stat()
+        if len(video_sample_sizes) < 10:
+            video_sample_sizes.append(video_stat.st_size)
+        thumbnail_path = output_path / f"{video_file.stem}.{fmt}"
+        if not force and thumbnail_path.exists():
+            thumb_stat = thumbnail_path.stat()
+            if thumb_stat.st_mtime > video_stat.st_mtime:
+                skipped += 1
+                total_thumb_size += thumb_stat.st_size
+                continue
+        if keyframe_seek:
+            aligned = nearest_keyframe(video_file, _timestamp_seconds(timestamp))
+            tasks.append((video_file, thumbnail_path, f"{aligned:.3f}", width, fmt))
+        else:
+            tasks.append((video_file, thumbnail_path, timestamp, width, fmt))
+    if skipped:
+        print(f"Skipping {skipped} up-to-date thumbnails (use --force to regenerate)")
+    if not tasks:
+        print("All thumbnails are up to date")
+        return True
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 4
+    print(f"Generating {len(tasks)} thumbnails with {max_workers} workers...")
+    start = time.time()
+    success = 0
+    failed = []
+
+    def report(i):
+        if i % 100 == 0 or i == len(tasks):
+            print(f"  {i}/{len(tasks)} done")
+
+    if _inprocess_encode(fmt):
+        # In-process JPEG encode is Python-side CPU work; spread it over
+        # a process pool.
+        # map() with a chunksize batches the task queue traffic; per-task
+        # submit() would cost one Future plus one IPC round trip each.
+        chunksize = max(1, len(tasks) // (max_workers * 4))
+        with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(_process_video, tasks, chunksize=chunksize)
+            for i, (video_name, ok, thumb_path) in enumerate(results, 1):
+                if ok:
+                    success += 1
+                    total_thumb_size += thumb_path.stat().st_size
+                else:
+                    failed.append(video_name)
+                report(i)
+    else:
+        # ffmpeg encodes the image itself: orchestrate the whole fleet
+        # from one event-loop thread instead of paying a worker process
+        # per concurrent ffmpeg.
+        results = asyncio.run(_run_ffmpeg_fleet(tasks, max_workers, report))
+        for video_name, ok, thumb_path in results:
+            if ok:
+                success += 1
+                total_thumb_size += thumb_path.stat().st_size
+            else:
+                failed.append(video_name)
+
+    elapsed = time.time() - start
+    print(f"Generated {success}/{len(tasks)} thumbnails in {elapsed:.1f}s")
+    if failed:
+        print(f"Failed ({len(failed)}): {', '.join(failed[:5])}"
+              + (" ..." if len(failed) > 5 else ""))
+
+    # Size statistics: thumbnails vs a sample of the source videos. Both
+    # were accumulated earlier in the run; no file is statted twice.
+    thumb_count = success + skipped
+    if thumb_count and video_sample_sizes:
+        avg_thumb_kb = total_thumb_size / thumb_count / 1024
+        avg_video_mb = (sum(video_sample_sizes) / len(video_sample_sizes)
+                        / (1024 * 1024))
+        print(f"Average thumbnail: {avg_thumb_kb:.1f} KB "
+              f"(video sample average: {avg_video_mb:.2f} MB)")
+    return success == len(tasks)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Generate thumbnails for the dataset preview videos")
+    parser.add_argument('--videos', default='docs/assets/videos',
+                        help='Directory containing the source videos')
+    parser.add_argument('--output', default='docs/assets/thumbnails',
+                        help='Directory to write the thumbnails into')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Number of parallel ffmpeg workers (default: CPU count)')
+    parser.add_argument('--timestamp', default='00:00:01',
+                        help='Frame timestamp to extract (default: 00:00:01)')
+    parser.add_argument('--width', type=int, default=320,
+                        help='Thumbnail width in pixels (default: 320)')
+    parser.add_argument('--format', choices=sorted(FORMAT_ARGS), default='jpg',
+                        help='Thumbnail image format (default: jpg)')
+    parser.add_argument('--force', action='store_true',
+                        help='Regenerate thumbnails even when newer than their video')
+    parser.add_argument('--keyframe-seek', action='store_true',
+                        help='Probe each video once and seek to the nearest '
+                             'keyframe instead of the fixed timestamp')
+    parser.add_argument('--input-list', metavar='FILE',
+                        help='Only process videos whose stem is listed in '
+                             'FILE (one per line)')
+    args = parser.parse_args()
+
+    if not check_ffmpeg():
+        print("Error: ffmpeg is required but was not found", file=sys.stderr)
+        sys.exit(1)
+
+    stems = None
+    if args.input_list:
+        with open(args.input_list, encoding='utf-8') as f:
+            stems = {line.strip() for line in f if line.strip()}
+
+    ok = generate_all_thumbnails(args.videos, args.output,
+                                 max_workers=args.workers,
+                                 timestamp=args.timestamp, width=args.width,
+                                 fmt=args.format, force=args.force,
+                                 keyframe_seek=args.keyframe_seek, stems=stems)
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
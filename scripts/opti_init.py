@@ -0,0 +1,460 @@
+#!/usr/bin/env python3
+"""
+One-time optimization initializer for the RoboCOIN DataManager site.
+
+Runs the build steps a fresh checkout needs before the static site is
+fully optimized: consolidating the per-dataset YAML metadata into
+consolidated_datasets.json and generating video thumbnails. Each step
+is skipped when its output already exists (use --force to redo).
+
+Usage:
+    python scripts/opti_init.py
+    python scripts/opti_init.py --force
+    python scripts/opti_init.py --skip-thumbnails
+"""
+
+import argparse
+import concurrent.futures
+import functools
+import hashlib
+import importlib.util
+import json
+import os
+import shutil
+import sys
+from pathlib import Path
+
+# subprocess and tempfile are only needed by the mutating steps; they
+# are imported inside those functions so the read-only --check path
+# skips their module-init cost entirely.
+
+
+class Colors:
+    HEADER = '\033[95m'
+    OKBLUE = '\033[94m'
+    OKGREEN = '\033[92m'
+    WARNING = '\033[93m'
+    FAIL = '\033[91m'
+    ENDC = '\033[0m'
+    BOLD = '\033[1m'
+
+
+# Escape codes are noise in CI logs and piped output; blank them out
+# unless stdout is an interactive terminal. NO_COLOR opts out explicitly
+# (https://no-color.org/).
+if not sys.stdout.isatty() or os.environ.get('NO_COLOR'):
+    for _attr in dir(Colors):
+        if not _attr.startswith('_'):
+            setattr(Colors, _attr, '')
+
+# Fixed parts of every message, assembled once (after the tty check so
+# they pick up the blanked codes) instead of re-interpolated per print.
+_RULE = f"{Colors.HEADER}{Colors.BOLD}{'=' * 60}{Colors.ENDC}"
+_HDR_PREFIX = f"{Colors.HEADER}{Colors.BOLD}"
+_SEC_PREFIX = f"\n{Colors.OKBLUE}{Colors.BOLD}--- "
+_SEC_SUFFIX = f" ---{Colors.ENDC}"
+_OK_PREFIX = f"{Colors.OKGREEN}[OK] "
+_WARN_PREFIX = f"{Colors.WARNING}[!] "
+_ERR_PREFIX = f"{Colors.FAIL}[X] "
+
+
+def print_header(text):
+    print(f"\n{_RULE}\n{_HDR_PREFIX}{text}{Colors.ENDC}\n{_RULE}")
+
+
+def print_section(text):
+    print(f"{_SEC_PREFIX}{text}{_SEC_SUFFIX}")
+
+
+def print_success(text):
+    print(f"{_OK_PREFIX}{text}{Colors.ENDC}")
+
+
+def print_warning(text):
+    print(f"{_WARN_PREFIX}{text}{Colors.ENDC}")
+
+
+def print_error(text):
+    print(f"{_ERR_PREFIX}{text}{Colors.ENDC}")
+
+
+# One scandir sweep per directory per run. The checkers and the final
+# verification all look at the same handful of directories; without the
+# cache each pass re-stats every file, which hurts badly on network
+# filesystems.
+_scan_cache = {}
+
+
+def scan_dir(path):
+    """Return [(name, stat_result)] for the files in `path`, memoized."""
+    key = os.fspath(path)
+    if key not in _scan_cache:
+        entries = []
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    if entry.is_file():
+                        entries.append((entry.name, entry.stat(follow_symlinks=False)))
+        except FileNotFoundError:
+            pass
+        _scan_cache[key] = entries
+    return _scan_cache[key]
+
+
+def invalidate_scan(path):
+    """Drop the cached sweep for `path` after its contents changed."""
+    _scan_cache.pop(os.fspath(path), None)
+
+
+# Build manifest recorded after a successful run. On the next run a
+# matching directory mtime lets the checkers skip the per-file walks
+# entirely, so an "already up to date" invocation costs a handful of
+# stats. Content edits to an existing YAML do not bump the directory
+# mtime; --force remains the escape hatch for that case.
+MANIFEST_NAME = '.opti_cache.json'
+_manifest = None
+
+
+def _manifest_path(project_root):
+    return project_root / 'docs' / 'assets' / MANIFEST_NAME
+
+
+def load_manifest(project_root):
+    global _manifest
+    if _manifest is None:
+        try:
+            with open(_manifest_path(project_root), encoding='utf-8') as f:
+                _manifest = json.load(f)
+        except (OSError, ValueError):
+            _manifest = {}
+    return _manifest
+
+
+def _dir_mtime(path):
+    try:
+        return os.stat(path).st_mtime
+    except FileNotFoundError:
+        return None
+
+
+def save_manifest(project_root):
+    """Record the current asset state, written atomically via rename."""
+    import tempfile
+    assets = project_root / 'docs' / 'assets'
+    video_names = sorted(name for name, _ in scan_dir(assets / 'videos')
+                         if name.endswith('.mp4'))
+    manifest = {
+        'yaml_dir_mtime': _dir_mtime(assets / 'dataset_info'),
+        'json_mtime': _dir_mtime(assets / 'info' / 'consolidated_datasets.json'),
+        'videos_dir_mtime': _dir_mtime(assets / 'videos'),
+        'thumbnails_dir_mtime': _dir_mtime(assets / 'thumbnails'),
+        'thumbnail_count': sum(1 for name, _ in scan_dir(assets / 'thumbnails')
+                               if name.endswith('.jpg')),
+        'video_count': len(video_names),
+        'video_names_hash': hashlib.blake2b(
+            ','.join(video_names).encode()).hexdigest(),
+    }
+    fd, tmp_path = tempfile.mkstemp(dir=assets, prefix=MANIFEST_NAME)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f)
+        os.replace(tmp_path, _manifest_path(project_root))
+    except OSError:
+        os.unlink(tmp_path)
+
+
+@functools.lru_cache(maxsize=None)
+def check_dependency(command, install_cmd=None, verify_version=False):
+    """Return True when `command` is on PATH (pure lookup, no subprocess).
+
+    Memoized: repeated probes for the same tool are dict lookups. With
+    `verify_version` the binary is actually executed, catching broken
+    installs that a PATH lookup would pass.
+    """
+    if shutil.which(command) is not None:
+        if verify_version:
+            import subprocess
+            try:
+                result = subprocess.run(
+                    [command, '-version'], stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            except OSError:
+                return False
+            if result.returncode != 0:
+                print_warning(f"{command} found but '-version' failed")
+                return False
+        return True
+    if install_cmd:
+        print_warning(f"{command} not found. Install with: {install_cmd}")
+    return False
+
+
+@functools.lru_cache(maxsize=None)
+def check_python_package(module, install_cmd=None):
+    """Return True when `module` is importable, without importing it."""
+    if importlib.util.find_spec(module) is not None:
+        return True
+    if install_cmd:
+        print_warning(f"Python package '{module}' not found. Install with: {install_cmd}")
+    return False
+
+
+def check_consolidated_json(project_root):
+    """Report on the consolidated metadata file; True when it is fresh.
+
+    A single os.stat answers existence and size in one syscall instead
+    of a .exists() probe followed by .stat(). Freshness is judged
+    against the newest source YAML mtime.
+    """
+    # Plain strings throughout: nothing here uses Path features, and the
+    # .gz sibling comes from one concatenation instead of a stringify
+    # plus re-parse into a fresh Path.
+    json_path = os.path.join(str(project_root), 'docs', 'assets', 'info',
+                             'consolidated_datasets.json')
+    yaml_dir = os.path.join(str(project_root), 'docs', 'assets', 'dataset_info')
+    try:
+        json_stat = os.stat(json_path)
+    except FileNotFoundError:
+        return False
+    print_success(f"consolidated_datasets.json: {json_stat.st_size / (1024 * 1024):.2f} MB")
+    # POSIX bumps a directory's mtime on create/delete/rename, so an
+    # unchanged dir mtime plus a JSON at least that new is an O(1)
+    # freshness predicate — no need to require the exact JSON mtime the
+    # manifest recorded, which would force a walk after every rebuild.
+    manifest = load_manifest(project_root)
+    yaml_dir_mtime = _dir_mtime(yaml_dir)
+    if (yaml_dir_mtime is not None
+            and manifest.get('yaml_dir_mtime') == yaml_dir_mtime
+            and json_stat.st_mtime >= yaml_dir_mtime):
+        return True
+    try:
+        gz_mb = os.stat(f"{json_path}.gz").st_size / (1024 * 1024)
+        print_success(f"consolidated_datasets.json.gz: {gz_mb:.2f} MB")
+    except FileNotFoundError:
+        print_warning("consolidated_datasets.json.gz missing (no precompressed variant)")
+    yaml_mtimes = [st.st_mtime for name, st in scan_dir(yaml_dir)
+                   if name.endswith(('.yml', '.yaml'))]
+    if yaml_mtimes and max(yaml_mtimes) > json_stat.st_mtime:
+        print_warning("consolidated_datasets.json is older than the newest YAML")
+        return False
+    return True
+
+
+def _run_step(cmd, cwd, quiet):
+    """Run a child script; with `quiet`, keep its output off the terminal.
+
+    Children printing thousands of progress lines can block on slow TTY
+    writes in CI log aggregators; DEVNULL removes that backpressure.
+    stderr is still captured so failures stay diagnosable.
+    """
+    import subprocess
+    if quiet:
+        result = subprocess.run(cmd, cwd=cwd, stdout=subprocess.DEVNULL,
+                                stderr=subprocess.PIPE, text=True)
+        if result.returncode != 0 and result.stderr:
+            for line in result.stderr.splitlines()[-5:]:
+                print_error(line)
+        return result.returncode
+    return subprocess.run(cmd, cwd=cwd).returncode
+
+
+def run_consolidation(project_root, force=False, quiet=False):
+    """Step 1: consolidate the per-dataset YAML files into one JSON."""
+    print_section("Step 1: Consolidate dataset metadata")
+    if not check_python_package('yaml', 'pip install pyyaml'):
+        print_error("PyYAML is required for metadata consolidation")
+        return False
+    if not force and check_consolidated_json(project_root):
+        print_warning("Consolidated JSON already exists, skipping (use --force)")
+        return True
+    returncode = _run_step(
+        [sys.executable, str(project_root / 'scripts' / 'consolidate_metadata.py')],
+        project_root, quiet)
+    if returncode != 0:
+        print_error("Consolidation failed")
+        return False
+    return check_consolidated_json(project_root)
+
+
+def check_thumbnails(project_root):
+    """Report on generated thumbnails; True when every video has one."""
+    thumbnails_dir = project_root / 'docs' / 'assets' / 'thumbnails'
+    videos_dir = project_root / 'docs' / 'assets' / 'videos'
+    manifest = load_manifest(project_root)
+    if (manifest.get('videos_dir_mtime') == _dir_mtime(videos_dir)
+            and manifest.get('thumbnails_dir_mtime') == _dir_mtime(thumbnails_dir)
+            and manifest.get('thumbnail_count', 0) >= manifest.get('video_count', 1)):
+        print_success(f"{manifest['thumbnail_count']} thumbnails (manifest)")
+        return True
+    count = 0
+    total = 0
+    for name, st in scan_dir(thumbnails_dir):
+        if name.endswith('.jpg'):
+            count += 1
+            total += st.st_size
+    if not count:
+        return False
+    print_success(f"{count} thumbnails ({total / (1024 * 1024):.1f} MB)")
+    video_count = sum(1 for name, _ in scan_dir(videos_dir)
+                      if name.endswith('.mp4'))
+    if video_count > count:
+        print_warning(f"{video_count - count} videos have no thumbnail")
+        return False
+    return True
+
+
+def missing_thumbnails(project_root):
+    """Return the set of video stems that have no thumbnail yet."""
+    assets = project_root / 'docs' / 'assets'
+    # Plain string slicing: PurePath.stem builds a Path object and
+    # re-parses the name on every call, which adds up across thousands
+    # of entries.
+    video_stems = {name[:name.rfind('.')] for name, _ in scan_dir(assets / 'videos')
+                   if name.endswith('.mp4')}
+    thumb_stems = {name[:name.rfind('.')] for name, _ in scan_dir(assets / 'thumbnails')
+                   if name.endswith('.jpg')}
+    return video_stems - thumb_stems
+
+
+def run_thumbnail_generation(project_root, force=False, verify_version=False,
+                             quiet=False):
+    """Step 2: generate one thumbnail per preview video."""
+    print_section("Step 2: Generate video thumbnails")
+    if not check_dependency('ffmpeg', 'apt install ffmpeg / brew install ffmpeg',
+                            verify_version=verify_version):
+        print_error("ffmpeg is required for thumbnail generation")
+        return False
+    if not force and check_thumbnails(project_root):
+        print_warning("Thumbnails already exist, skipping (use --force)")
+        return True
+    # One worker per core, clamped: a 2-core container should not be
+    # oversubscribed and past 32 ffmpeg processes disk I/O saturates.
+    workers = max(2, min(32, os.cpu_count() or 4))
+    cmd = [sys.executable, str(project_root / 'scripts' / 'generate_thumbnails.py'),
+           '--workers', str(workers)]
+    if force:
+        cmd.append('--force')
+    # On incremental runs we already know the exact delta; hand it to
+    # the child so it does not re-enumerate and mtime-check every video.
+    missing = None if force else missing_thumbnails(project_root)
+    missing_file = None
+    if missing:
+        import tempfile
+        missing_file = tempfile.NamedTemporaryFile(
+            'w', suffix='.txt', delete=False, encoding='utf-8')
+        missing_file.write('\n'.join(sorted(missing)))
+        missing_file.close()
+        cmd += ['--input-list', missing_file.name]
+    try:
+        returncode = _run_step(cmd, project_root, quiet)
+    finally:
+        if missing_file is not None:
+            os.unlink(missing_file.name)
+    if returncode != 0:
+        print_error("Thumbnail generation failed")
+        return False
+    invalidate_scan(project_root / 'docs' / 'assets' / 'thumbnails')
+    return check_thumbnails(project_root)
+
+
+def warm_scan_cache(project_root):
+    """Sweep the asset directories concurrently to populate scan_dir.
+
+    stat() releases the GIL, so on network filesystems the per-entry
+    round trips of the three sweeps overlap instead of serializing.
+    """
+    assets = project_root / 'docs' / 'assets'
+    dirs = [assets / 'dataset_info', assets / 'thumbnails', assets / 'videos']
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(dirs)) as executor:
+        list(executor.map(scan_dir, dirs))
+
+
+def verify_optimizations(project_root, json_ok=None, thumbs_ok=None):
+    """Final check that both optimization outputs are in place.
+
+    Steps that already ran pass their check results in; only a state
+    nobody computed yet triggers I/O of its own.
+    """
+    print_section("Verification")
+    if json_ok is None or thumbs_ok is None:
+        warm_scan_cache(project_root)
+    if json_ok is None:
+        json_ok = check_consolidated_json(project_root)
+    if thumbs_ok is None:
+        thumbs_ok = check_thumbnails(project_root)
+    if json_ok:
+        print_success("Consolidated metadata present")
+    else:
+        print_error("Consolidated metadata missing or stale")
+    if thumbs_ok:
+        print_success("Thumbnails present")
+    else:
+        print_error("Thumbnails missing")
+    return json_ok and thumbs_ok
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Initialize the site's performance optimizations")
+    parser.add_argument('--force', action='store_true',
+                        help='Regenerate outputs even when they already exist')
+    parser.add_argument('--skip-consolidation', action='store_true',
+                        help='Skip the metadata consolidation step')
+    parser.add_argument('--skip-thumbnails', action='store_true',
+                        help='Skip the thumbnail generation step')
+    parser.add_argument('--check', action='store_true',
+                        help='Only report the current state, run nothing')
+    parser.add_argument('--verify-version', action='store_true',
+                        help='Actually execute dependencies to verify they run, '
+                             'instead of only checking PATH')
+    parser.add_argument('--quiet', action='store_true',
+                        help="Suppress the child scripts' progress output")
+    args = parser.parse_args()
+
+    project_root = Path(__file__).resolve().parent.parent
+    # One EAFP stat up front; the per-directory checkers already handle
+    # absent subdirectories via FileNotFoundError in their own sweeps.
+    try:
+        os.stat(project_root / 'docs' / 'assets')
+    except FileNotFoundError:
+        print_error(f"docs/assets not found under {project_root}")
+        sys.exit(1)
+    print_header("RoboCOIN DataManager optimization init")
+
+    if args.check:
+        # Both checkers inspect disjoint directories; run them
+        # concurrently so stat latency overlaps.
+        warm_scan_cache(project_root)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            checks = [executor.submit(check_consolidated_json, project_root),
+                      executor.submit(check_thumbnails, project_root)]
+            ok = all(f.result() for f in checks)
+        sys.exit(0 if ok else 1)
+
+    # The two steps touch disjoint trees (dataset_info/ vs thumbnails/)
+    # and both do their heavy lifting in subprocesses, so they overlap
+    # cleanly: YAML consolidation is CPU-bound while thumbnail
+    # generation mostly waits on ffmpeg.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        json_future = thumbs_future = None
+        if not args.skip_consolidation:
+            json_future = executor.submit(run_consolidation, project_root,
+                                          args.force, args.quiet)
+        if not args.skip_thumbnails:
+            thumbs_future = executor.submit(run_thumbnail_generation, project_root,
+                                           args.force, args.verify_version,
+                                           args.quiet)
+        json_ok = json_future.result() if json_future else None
+        thumbs_ok = thumbs_future.result() if thumbs_future else None
+
+    success = verify_optimizations(project_root, json_ok, thumbs_ok)
+    if success:
+        save_manifest(project_root)
+        print_header("All optimizations in place")
+    else:
+        print_header("Some optimizations failed — see messages above")
+    sys.exit(0 if success else 1)
+
+
+if __name__ == '__main__':
+    main()
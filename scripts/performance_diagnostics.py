@@ -0,0 +1,852 @@
+#!/usr/bin/env python3
+"""
+Performance diagnostics for the RoboCOIN DataManager site.
+
+Walks the docs/ asset tree, measures what the browser would have to
+fetch, and writes a prioritized report of load-time bottlenecks with
+concrete recommendations. Outputs:
+
+    performance_diagnostics_report.txt   human-readable report
+    performance_diagnostics_results.json raw numbers for tooling
+
+Usage:
+    python scripts/performance_diagnostics.py
+"""
+
+import argparse
+import array
+import bisect
+import hashlib
+import io
+import json
+import mmap
+import operator
+import os
+import re
+import sys
+import tempfile
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from enum import IntEnum
+from pathlib import Path
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as _YamlLoader   # libyaml, ~5-10x faster
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dump_json_bytes(obj):
+    """Serialize for disk: orjson (Rust, ~10x stdlib) when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode()
+
+
+# Rough planning figures for load-time estimates.
+ASSUMED_BANDWIDTH_BPS = 10 * 1024 * 1024 / 8   # 10 Mbit/s effective
+ASSUMED_RTT_S = 0.05                            # 50ms per request
+VISIBLE_THUMBNAILS = 12                         # first viewport
+
+
+class Severity(IntEnum):
+    """Bottleneck severity; lower sorts first."""
+    CRITICAL = 0
+    HIGH = 1
+    MEDIUM = 2
+    LOW = 3
+
+
+def _sev_name(value):
+    """Severity label for either numeric or already-stringified values."""
+    return value if isinstance(value, str) else Severity(value).name
+
+
+_HAS_FADVISE = hasattr(os, 'posix_fadvise')  # absent on Windows
+
+# Phases whose results another phase reads (auto-run on subset runs).
+_PHASE_DEPS = {
+    'network_requests': ('file_structure',),
+    'initial_load': ('asset_sizes', 'network_requests'),
+    'recommendations': ('asset_sizes', 'network_requests', 'initial_load',
+                        'caching'),
+}
+
+# Top-level YAML mapping keys: column 0, identifier, colon.
+_TOP_KEY_RE = re.compile(rb'(?m)^([A-Za-z_][\w-]*):')
+# List items inside the objects block (column 0 in this schema).
+_LIST_ITEM_RE = re.compile(rb'(?m)^- ')
+_EQ = '=' * 80
+_DASH = '-' * 80
+
+
+@dataclass(frozen=True, slots=True)
+class Recommendation:
+    """Static recommendation body, emitted when its category fires."""
+    priority: Severity
+    requires: str | None
+    title: str
+    details: tuple
+
+
+# Recommendation bodies are constant across runs; generate_recommendations
+# only filters this table against the observed bottleneck categories.
+_RECS = (
+    Recommendation(
+        Severity.CRITICAL, 'Network Requests',
+        'Consolidate per-dataset metadata into one JSON',
+        ('Merge all YAML files into consolidated_datasets.json '
+         '(scripts/consolidate_metadata.py)',
+         'Load it once at startup and index in memory',
+         'Keep per-file YAML only as the authoring format')),
+    Recommendation(
+        Severity.HIGH, 'Asset Sizes',
+        'Serve thumbnails, lazy-load videos',
+        ('Generate one small JPEG per video '
+         '(scripts/generate_thumbnails.py)',
+         'Only attach video sources when a card is hovered',
+         'Consider WebP thumbnails for a further ~30% saving')),
+    Recommendation(
+        Severity.HIGH, 'Initial Load',
+        'Trim the critical path',
+        ('Virtual-scroll the grid so offscreen cards cost nothing',
+         'Defer non-critical JS modules',
+         'Show a progressive loading indicator during startup')),
+    Recommendation(
+        Severity.MEDIUM, 'Caching',
+        'Cache aggressively for repeat visits',
+        ('Add a service worker caching immutable assets',
+         'Precompress the consolidated JSON (.gz)',
+         'Fingerprint asset URLs so caches can be permanent')),
+    Recommendation(
+        Severity.LOW, None,
+        'Track these numbers over time',
+        ('Run this script in CI and diff the JSON output',
+         'Alert when initial payload or request count regresses')),
+)
+
+
+@dataclass(slots=True)
+class FileRec:
+    """One file seen during the index sweep."""
+    name: str
+    path: str
+    size: int
+    ino: int = 0
+
+
+@dataclass(slots=True)
+class CategorySizes:
+    """Size statistics for one asset category."""
+    count: int = 0
+    total_bytes: int = 0
+    min: int = 0
+    max: int = 0
+    avg: float = 0.0
+    p50: int = 0
+    p95: int = 0
+
+
+@dataclass(slots=True)
+class FileStructure:
+    """File counts per category."""
+    yaml_files: int = 0
+    json_files: int = 0
+    video_files: int = 0
+    thumbnail_files: int = 0
+    js_files: int = 0
+    css_files: int = 0
+
+
+@dataclass(slots=True)
+class NetworkRequests:
+    """Request counts for the first page load."""
+    html: int = 1
+    css: int = 0
+    js: int = 0
+    metadata: int = 0
+    visible_thumbnails: int = 0
+    uses_consolidated_json: bool = False
+    initial_total: int = 0
+
+
+@dataclass(slots=True)
+class InitialLoad:
+    """First-load payload and time estimate."""
+    payload_bytes: int = 0
+    payload_mb: float = 0.0
+    estimated_seconds: float = 0.0
+
+
+@dataclass(slots=True)
+class Caching:
+    """Caching posture of the deployed site."""
+    service_worker: bool = False
+    precompressed_json: bool = False
+
+
+class PerformanceDiagnostics:
+    """Seven-phase static analysis of the site's load-time behaviour."""
+
+    __slots__ = ('project_root', 'docs_dir', 'dataset_info_dir', 'videos_dir',
+                 'thumbnails_dir', 'info_dir', 'results', 'workers',
+                 'fast_yaml', '_file_index', '_bottleneck_categories')
+
+    def __init__(self, project_root=None, workers=None, fast_yaml=False):
+        if project_root is None:
+            project_root = Path(__file__).resolve().parent.parent
+        self.project_root = Path(project_root)
+        self.docs_dir = self.project_root / 'docs'
+        self.dataset_info_dir = self.docs_dir / 'assets' / 'dataset_info'
+        self.videos_dir = self.docs_dir / 'assets' / 'videos'
+        self.thumbnails_dir = self.docs_dir / 'assets' / 'thumbnails'
+        self.info_dir = self.docs_dir / 'assets' / 'info'
+        self.results = {
+            'timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'detailed_analysis': {},
+            'bottlenecks': [],
+            'recommendations': [],
+        }
+        # stat/open release the GIL, so threads overlap syscall latency
+        self.workers = workers or min(32, (os.cpu_count() or 4) * 4)
+        self.fast_yaml = fast_yaml
+        self._file_index = None
+        self._bottleneck_categories = set()
+
+    # ------------------------------------------------------------------
+    # Filesystem access
+
+    @staticmethod
+    def _walk(root):
+        """Yield FileRec for every file under `root`, one scandir per dir.
+
+        The DirEntry stat comes from the same readdir batch, so
+        classifying and sizing a 2000-file directory costs one pass
+        instead of a glob+stat pair per pattern. Symlinked directories
+        are not followed.
+        """
+        stack = [os.fspath(root)]
+        while stack:
+            directory = stack.pop()
+            try:
+                with os.scandir(directory) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file():
+                            st = entry.stat()
+                            yield FileRec(entry.name, entry.path,
+                                          st.st_size, st.st_ino)
+            except FileNotFoundError:
+                pass
+
+    def _build_index(self):
+        """One recursive enumeration of docs/, bucketed by extension.
+
+        Every phase reads from this index instead of re-walking the
+        tree, so a full run pays the getdents/stat traffic exactly once
+        regardless of how many phases consume it. Extension dispatch
+        goes through one dict; .json is disambiguated by directory
+        (dataset_info vs. the consolidated index in info/).
+        """
+        ext_map = {'.mp4': 'videos', '.jpg': 'thumbnails',
+                   '.js': 'js', '.css': 'css'}
+        dataset_info = os.fspath(self.dataset_info_dir)
+        info = os.fspath(self.info_dir)
+        index = {
+            'yaml': [], 'json': [], 'videos': [], 'thumbnails': [],
+            'json_index': [], 'js': [], 'css': [],
+        }
+        try:
+            with os.scandir(self.docs_dir) as it:
+                subdirs = [entry.path for entry in it
+                           if entry.is_dir(follow_symlinks=False)]
+        except FileNotFoundError:
+            subdirs = []
+        # One walker thread per top-level subtree; getdents/stat release
+        # the GIL so the enumerations overlap.
+        with ThreadPoolExecutor(max_workers=min(self.workers,
+                                                max(1, len(subdirs)))) as pool:
+            for recs in pool.map(lambda d: list(self._walk(d)), subdirs):
+                for rec in recs:
+                    if rec.name.startswith('.'):
+                        continue  # cache/trash sidecars, not site assets
+                    dot = rec.name.rfind('.')
+                    ext = rec.name[dot:] if dot != -1 else ''
+                    if ext in ('.yml', '.yaml', '.json'):
+                        # metadata buckets are directory-scoped so that
+                        # e.g. workflow YAML does not skew the stats
+                        parent = os.path.dirname(rec.path)
+                        if parent == dataset_info:
+                            index['yaml' if ext != '.json'
+                                  else 'json'].append(rec)
+                        elif parent == info and ext == '.json':
+                            index['json_index'].append(rec)
+                        continue
+                    bucket = ext_map.get(ext)
+                    if bucket is not None:
+                        index[bucket].append(rec)
+        return index
+
+    @property
+    def file_index(self):
+        if self._file_index is None:
+            self._file_index = self._build_index()
+        return self._file_index
+
+    def _signature(self):
+        """Content signature of the asset tree for run memoization.
+
+        blake2b over sorted (path, size, mtime_ns) tuples of every
+        directory the phases read — metadata, videos, thumbnails, the
+        consolidated info/ outputs and the js/css bundles — plus the
+        service-worker file the caching phase probes. If none of those
+        changed, a previous run's output is still valid.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        roots = (self.dataset_info_dir, self.videos_dir,
+                 self.thumbnails_dir, self.info_dir,
+                 self.docs_dir / 'js', self.docs_dir / 'css')
+        for root in roots:
+            entries = []
+            stack = [os.fspath(root)]
+            while stack:
+                directory = stack.pop()
+                try:
+                    with os.scandir(directory) as it:
+                        for entry in it:
+                            if entry.name.startswith('.'):
+                                continue
+                            if entry.is_dir(follow_symlinks=False):
+                                stack.append(entry.path)
+                            elif entry.is_file():
+                                st = entry.stat()
+                                entries.append(
+                                    f'{entry.path}\0{st.st_size}\0'
+                                    f'{st.st_mtime_ns}\n')
+                except FileNotFoundError:
+                    pass
+            for line in sorted(entries):
+                digest.update(line.encode())
+        try:
+            st = os.stat(self.docs_dir / 'sw.js')
+            digest.update(f'sw.js\0{st.st_size}\0{st.st_mtime_ns}\n'.encode())
+        except FileNotFoundError:
+            digest.update(b'sw.js\0absent\n')
+        return digest.hexdigest()
+
+    def _add_bottleneck(self, category, severity, description, impact):
+        # Insert sorted by severity so the report needs no sort pass, and
+        # track categories in a set so recommendation checks are O(1)
+        # lookups rather than linear scans of the bottleneck list.
+        bisect.insort(
+            self.results['bottlenecks'],
+            {'category': category, 'severity': severity,
+             'description': description, 'impact': impact},
+            key=operator.itemgetter('severity'))
+        self._bottleneck_categories.add(category)
+
+    # ------------------------------------------------------------------
+    # Phase 1: what is on disk
+
+    def analyze_file_structure(self):
+        print('Phase 1: analyzing file structure...')
+        index = self.file_index
+        structure = FileStructure(
+            yaml_files=len(index['yaml']),
+            json_files=len(index['json']),
+            video_files=len(index['videos']),
+            thumbnail_files=len(index['thumbnails']),
+            js_files=len(index['js']),
+            css_files=len(index['css']),
+        )
+        self.results['detailed_analysis']['file_structure'] = asdict(structure)
+        return self.results['detailed_analysis']['file_structure']
+
+    # ------------------------------------------------------------------
+    # Phase 2: how big everything is
+
+    def analyze_asset_sizes(self):
+        print('Phase 2: analyzing asset sizes...')
+        buckets = (
+            ('dataset_metadata', 'yaml'),
+            ('videos', 'videos'),
+            ('thumbnails', 'thumbnails'),
+            ('json_index', 'json_index'),
+        )
+        sizes = {}
+        for category, index_key in buckets:
+            # Unboxed int64 buffer instead of a list of Python ints; the
+            # reductions run at C speed over the raw buffer.
+            buf = array.array('q',
+                              (rec.size for rec in self.file_index[index_key]))
+            if np is not None and buf:
+                arr = np.frombuffer(buf, dtype=np.int64)
+                total = int(arr.sum())
+                lo, p50, p95, hi = (
+                    int(v) for v in np.quantile(arr, (0.0, 0.5, 0.95, 1.0)))
+                avg = float(arr.mean())
+            elif buf:
+                total = sum(buf)
+                avg = total / len(buf)
+                ordered = sorted(buf)
+                lo, hi = ordered[0], ordered[-1]
+                p50 = ordered[(len(ordered) - 1) // 2]
+                p95 = ordered[round(0.95 * (len(ordered) - 1))]
+            else:
+                total, lo, hi, avg, p50, p95 = 0, 0, 0, 0.0, 0, 0
+            sizes[category] = CategorySizes(count=len(buf), total_bytes=total,
+                                            min=lo, max=hi, avg=avg,
+                                            p50=p50, p95=p95)
+        # slot attributes while computing; plain dicts only at the
+        # serialization boundary
+        self.results['detailed_analysis']['asset_sizes'] = {
+            category: asdict(stats) for category, stats in sizes.items()}
+
+        video_mb = sizes['videos'].total_bytes / (1024 * 1024)
+        if video_mb > 100:
+            self._add_bottleneck(
+                'Asset Sizes', Severity.HIGH,
+                f'Videos total {video_mb:.0f} MB on disk',
+                'Eagerly loaded videos would dominate bandwidth; '
+                'they must stay lazy-loaded')
+        # p95 instead of the mean: size distributions here are skewed and
+        # a handful of huge files is exactly what we want to catch
+        meta_p95_kb = sizes['dataset_metadata'].p95 / 1024
+        if meta_p95_kb > 50:
+            self._add_bottleneck(
+                'Asset Sizes', Severity.MEDIUM,
+                f'p95 metadata file is {meta_p95_kb:.0f} KB',
+                'Large per-dataset metadata slows every detail view')
+        video_p95_mb = sizes['videos'].p95 / (1024 * 1024)
+        if video_p95_mb > 5:
+            self._add_bottleneck(
+                'Asset Sizes', Severity.MEDIUM,
+                f'p95 video is {video_p95_mb:.1f} MB',
+                'Oversized previews stall hover playback on slow links')
+        return self.results['detailed_analysis']['asset_sizes']
+
+    # ------------------------------------------------------------------
+    # Phase 3: metadata shape
+
+    @staticmethod
+    def _load_yaml(rec):
+        """Full parse: (top-level keys, objects count) via libyaml.
+
+        Reads through a raw fd with posix_fadvise so the kernel
+        prefetches the whole file asynchronously before the parse
+        touches it; mostly matters on cold page cache.
+        """
+        try:
+            fd = os.open(rec.path, os.O_RDONLY)
+            try:
+                if _HAS_FADVISE:
+                    os.posix_fadvise(fd, 0, 0,
+                                     os.POSIX_FADV_SEQUENTIAL
+                                     | os.POSIX_FADV_WILLNEED)
+                raw = os.read(fd, rec.size)
+            finally:
+                os.close(fd)
+            data = yaml.load(raw, Loader=_YamlLoader)
+        except (OSError, yaml.YAMLError):
+            return None, 0
+        if not isinstance(data, dict):
+            return None, 0
+        objects = data.get('objects')
+        return list(data), len(objects) if isinstance(objects, list) else 0
+
+    @staticmethod
+    def _scan_yaml_bytes(rec):
+        """Byte-level scan: same counts with no parser stack.
+
+        mmaps the file and extracts top-level keys with one precompiled
+        regex pass; the objects count is the number of list items between
+        the `objects:` anchor and the next top-level key. O(bytes) in C
+        loops versus O(tokens) in the parser — the correctness oracle is
+        the default full-parse path.
+        """
+        try:
+            with open(rec.path, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                keys = [m.group(1).decode('utf-8', 'replace')
+                        for m in _TOP_KEY_RE.finditer(mm)]
+                n_objects = 0
+                anchor = mm.find(b'\nobjects:')
+                if anchor != -1:
+                    nxt = _TOP_KEY_RE.search(mm, anchor + len(b'\nobjects:'))
+                    end = nxt.start() if nxt else len(mm)
+                    n_objects = len(_LIST_ITEM_RE.findall(mm[anchor:end]))
+        except (OSError, ValueError):
+            return None, 0
+        return keys, n_objects
+
+    def analyze_yaml_complexity(self, sample_size=50):
+        print('Phase 3: analyzing YAML complexity...')
+        from collections import Counter
+        # The consolidated bundle already holds every parsed record; one
+        # JSON load beats any number of YAML parses, and it covers the
+        # whole tree instead of a sample.
+        bundle = self.info_dir / 'consolidated_datasets.json'
+        try:
+            raw = bundle.read_bytes()
+        except OSError:
+            raw = None
+        if raw is not None:
+            records = (orjson.loads(raw) if orjson is not None
+                       else json.loads(raw))
+            common_fields = Counter()
+            total_fields = 0
+            max_objects = 0
+            for data in records.values():
+                if not isinstance(data, dict):
+                    continue
+                common_fields.update(data.keys())
+                total_fields += len(data)
+                objects = data.get('objects')
+                if isinstance(objects, list) and len(objects) > max_objects:
+                    max_objects = len(objects)
+            parsed = len(records)
+            complexity = {
+                'sampled': parsed,
+                'avg_fields': total_fields / parsed if parsed else 0,
+                'max_objects': max_objects,
+                'common_fields': dict(common_fields),
+            }
+            self.results['detailed_analysis']['yaml_complexity'] = complexity
+            return complexity
+
+        sample = sorted(self.file_index['yaml'],
+                        key=lambda rec: rec.name)[:sample_size]
+        # select by name for determinism, read in inode order for locality
+        sample.sort(key=lambda rec: rec.ino)
+        common_fields = Counter()
+        total_fields = 0
+        max_objects = 0
+        parsed = 0
+        scan = self._scan_yaml_bytes if self.fast_yaml else self._load_yaml
+        # Parse in threads (open/read release the GIL and libyaml/re do the
+        # heavy lifting in C); aggregate in the main thread only.
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            for keys, n_objects in pool.map(scan, sample):
+                if keys is None:
+                    continue
+                parsed += 1
+                # one C-level Counter.update per document instead of a
+                # Python-level increment per field
+                common_fields.update(keys)
+                total_fields += len(keys)
+                if n_objects > max_objects:
+                    max_objects = n_objects
+        complexity = {
+            'sampled': parsed,
+            'avg_fields': total_fields / parsed if parsed else 0,
+            'max_objects': max_objects,
+            'common_fields': dict(common_fields),
+        }
+        self.results['detailed_analysis']['yaml_complexity'] = complexity
+        return complexity
+
+    # ------------------------------------------------------------------
+    # Phase 4: how many requests the first paint costs
+
+    def analyze_network_requests(self):
+        print('Phase 4: analyzing network requests...')
+        structure = self.results['detailed_analysis'].get('file_structure')
+        if structure is None:
+            structure = self.analyze_file_structure()
+        consolidated = (self.info_dir / 'consolidated_datasets.json').exists()
+        requests = NetworkRequests(
+            css=structure['css_files'],
+            js=structure['js_files'],
+            metadata=1 if consolidated else structure['yaml_files'],
+            visible_thumbnails=min(VISIBLE_THUMBNAILS,
+                                   structure['thumbnail_files']),
+            uses_consolidated_json=consolidated,
+        )
+        requests.initial_total = (requests.html + requests.css + requests.js
+                                  + requests.metadata
+                                  + requests.visible_thumbnails)
+        self.results['detailed_analysis']['network_requests'] = asdict(requests)
+
+        if not consolidated and structure['yaml_files'] > 100:
+            self._add_bottleneck(
+                'Network Requests', Severity.CRITICAL,
+                f"Initial load fetches {structure['yaml_files']} individual "
+                'metadata files',
+                'Hundreds of sequentialized requests dominate time to first '
+                'render; consolidate into one JSON')
+        elif requests.initial_total > 100:
+            self._add_bottleneck(
+                'Network Requests', Severity.MEDIUM,
+                f'Initial load issues ~{requests.initial_total} requests',
+                'Request count inflates load time on high-latency links')
+        return self.results['detailed_analysis']['network_requests']
+
+    # ------------------------------------------------------------------
+    # Phase 5: how long the first paint takes
+
+    def analyze_initial_load(self):
+        print('Phase 5: estimating initial load...')
+        analysis = self.results['detailed_analysis']
+        sizes = analysis.get('asset_sizes') or self.analyze_asset_sizes()
+        requests = analysis.get('network_requests') or self.analyze_network_requests()
+
+        if requests['uses_consolidated_json']:
+            metadata_bytes = sizes['json_index']['total_bytes']
+        else:
+            metadata_bytes = sizes['dataset_metadata']['total_bytes']
+        thumb_avg = sizes['thumbnails']['avg']
+        payload = (metadata_bytes
+                   + requests['visible_thumbnails'] * thumb_avg
+                   + 512 * 1024)  # html/css/js allowance
+        transfer_s = payload / ASSUMED_BANDWIDTH_BPS
+        latency_s = requests['initial_total'] * ASSUMED_RTT_S / 6  # 6-way parallel
+        estimate = InitialLoad(
+            payload_bytes=int(payload),
+            payload_mb=payload / (1024 * 1024),
+            estimated_seconds=transfer_s + latency_s,
+        )
+        self.results['detailed_analysis']['initial_load'] = asdict(estimate)
+
+        if estimate.estimated_seconds > 5:
+            self._add_bottleneck(
+                'Initial Load', Severity.HIGH,
+                f'Estimated first load takes {estimate.estimated_seconds:.1f}s '
+                f'({estimate.payload_mb:.1f} MB)',
+                'Users on average connections wait too long for first render')
+        return self.results['detailed_analysis']['initial_load']
+
+    # ------------------------------------------------------------------
+    # Phase 6: caching posture
+
+    def analyze_caching(self):
+        print('Phase 6: analyzing caching...')
+        caching = Caching(
+            service_worker=(self.docs_dir / 'sw.js').exists(),
+            precompressed_json=(self.info_dir
+                                / 'consolidated_datasets.json.gz').exists(),
+        )
+        self.results['detailed_analysis']['caching'] = asdict(caching)
+        if not caching.service_worker:
+            self._add_bottleneck(
+                'Caching', Severity.MEDIUM,
+                'No service worker: repeat visits re-fetch every asset',
+                'Returning users pay the full load every time')
+        if not caching.precompressed_json:
+            self._add_bottleneck(
+                'Caching', Severity.LOW,
+                'No precompressed (.gz) variant of the consolidated JSON',
+                'Transfer is larger than necessary where the host honours '
+                'precompressed assets')
+        return self.results['detailed_analysis']['caching']
+
+    # ------------------------------------------------------------------
+    # Phase 7: what to do about it
+
+    def generate_recommendations(self):
+        print('Phase 7: generating recommendations...')
+        categories = self._bottleneck_categories
+        recommendations = [
+            {'priority': rec.priority.name, 'title': rec.title,
+             'details': list(rec.details)}
+            for rec in _RECS
+            if rec.requires is None or rec.requires in categories
+        ]
+        self.results['recommendations'] = recommendations
+        return recommendations
+
+    # ------------------------------------------------------------------
+    # Output
+
+    def _write_report(self, w):
+        """Render the report through the write callable `w`."""
+        w(f'{_EQ}\nRoboCOIN DataManager — performance diagnostics\n'
+          f"Generated: {self.results['timestamp']}\n{_EQ}\n")
+
+        structure = self.results['detailed_analysis'].get('file_structure', {})
+        w(f'\nFile structure\n{_DASH}\n')
+        for key, value in structure.items():
+            w(f'  {key}: {value}\n')
+
+        sizes = self.results['detailed_analysis'].get('asset_sizes', {})
+        w(f'\nAsset sizes\n{_DASH}\n')
+        for category, data in sizes.items():
+            w(f"  {category}: {data['count']} files, "
+              f"{data['total_bytes'] / (1024 * 1024):.2f} MB total, "
+              f"avg {data['avg'] / 1024:.1f} KB, "
+              f"p50 {data['p50'] / 1024:.1f} KB, "
+              f"p95 {data['p95'] / 1024:.1f} KB\n")
+
+        load = self.results['detailed_analysis'].get('initial_load', {})
+        if load:
+            w(f'\nInitial load estimate\n{_DASH}\n')
+            w(f"  payload: {load['payload_mb']:.2f} MB\n")
+            w(f"  estimated: {load['estimated_seconds']:.1f}s\n")
+
+        w(f'\nBottlenecks\n{_DASH}\n')
+        # bottlenecks are kept severity-sorted at insertion time
+        ordered = self.results['bottlenecks']
+        w(''.join(f"  [{_sev_name(b['severity'])}] "
+                  f"{b['category']}: {b['description']}\n"
+                  f"      impact: {b['impact']}\n" for b in ordered))
+        if not ordered:
+            w('  none found\n')
+
+        w(f'\nRecommendations\n{_DASH}\n')
+        w(''.join(f"  [{rec['priority']}] {rec['title']}\n"
+                  + ''.join(f'      - {detail}\n' for detail in rec['details'])
+                  for rec in self.results['recommendations']))
+
+        w(f'\n{_EQ}\n')
+
+    def generate_report(self, output_file='performance_diagnostics_report.txt',
+                        return_text=False):
+        """Write the report, streaming into the open file handle.
+
+        No full report string is ever materialized unless the caller
+        asks for it back with return_text=True.
+        """
+        if return_text:
+            buf = io.StringIO()
+            self._write_report(buf.write)
+            text = buf.getvalue()
+            with open(self.project_root / output_file, 'w',
+                      encoding='utf-8') as f:
+                f.write(text)
+            return text
+        with open(self.project_root / output_file, 'w',
+                  encoding='utf-8') as f:
+            self._write_report(f.write)
+        return None
+
+    def save_json_results(self, output_file='performance_diagnostics_results.json'):
+        # severities are stored numerically for sorting; emit names
+        for b in self.results['bottlenecks']:
+            if not isinstance(b['severity'], str):
+                b['severity'] = Severity(b['severity']).name
+        with open(self.project_root / output_file, 'wb') as f:
+            f.write(_dump_json_bytes(self.results))
+
+    def _phase_registry(self):
+        """Ordered phase name -> method map (definition order = run order)."""
+        return OrderedDict([
+            ('file_structure', self.analyze_file_structure),
+            ('asset_sizes', self.analyze_asset_sizes),
+            ('yaml_complexity', self.analyze_yaml_complexity),
+            ('network_requests', self.analyze_network_requests),
+            ('initial_load', self.analyze_initial_load),
+            ('caching', self.analyze_caching),
+            ('recommendations', self.generate_recommendations),
+        ])
+
+    def run_full_diagnostics(self, selected=None,
+                             json_output='performance_diagnostics_results.json'):
+        """Run the diagnostic phases, or only `selected` phase names.
+
+        A subset run auto-runs each selected phase's prerequisites and
+        skips the signature cache (partial results must not shadow a
+        cached full run).
+        """
+        start = time.time()
+        self._file_index = None  # re-stat if run twice in one process
+        phases = self._phase_registry()
+
+        sig = self._signature()
+        # one sig per results file: a signature only ever validates the
+        # output the same invocation wrote, so alternating --json paths
+        # cannot serve each other's stale results
+        results_path = self.project_root / json_output
+        sig_path = results_path.with_name(results_path.name + '.sig')
+        if selected is None:
+            try:
+                if sig_path.read_text().strip() == sig:
+                    with open(results_path, encoding='utf-8') as f:
+                        self.results = json.load(f)
+                    print('docs/ unchanged since last run; reusing cached '
+                          f'results ({time.time() - start:.2f}s)')
+                    return self.results
+            except (OSError, json.JSONDecodeError):
+                pass
+            to_run = set(phases)
+        else:
+            unknown = set(selected) - set(phases)
+            if unknown:
+                raise ValueError(
+                    f"unknown phases: {', '.join(sorted(unknown))} "
+                    f"(choose from {', '.join(phases)})")
+            # transitive prerequisite closure
+            to_run = set()
+            pending = list(selected)
+            while pending:
+                name = pending.pop()
+                if name not in to_run:
+                    to_run.add(name)
+                    pending.extend(_PHASE_DEPS.get(name, ()))
+
+        for name, method in phases.items():
+            if name in to_run:
+                method()
+        self.generate_report()
+        self.save_json_results(json_output)
+        if selected is None:
+            fd, tmp = tempfile.mkstemp(dir=self.project_root,
+                                       suffix='.sig.tmp')
+            with os.fdopen(fd, 'w') as f:
+                f.write(sig)
+            os.replace(tmp, sig_path)
+        else:
+            # the results file now holds partial output; drop the
+            # signature so the next full run cannot mistake it for a
+            # cached full run
+            sig_path.unlink(missing_ok=True)
+        self._write_report(sys.stdout.write)  # echo without rebuilding
+        print(f'Diagnostics finished in {time.time() - start:.2f}s')
+        return self.results
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Static performance diagnostics for the docs/ site')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='I/O thread count (default: min(32, cpus*4))')
+    parser.add_argument('--fast-yaml', action='store_true',
+                        help='scan YAML at byte level instead of parsing '
+                             '(faster, schema-specific)')
+    parser.add_argument('--phases', default=None,
+                        help='comma-separated phase names to run (others are '
+                             'skipped; prerequisites run automatically)')
+    parser.add_argument('--json', default='performance_diagnostics_results.json',
+                        help='path (under the project root) for the JSON '
+                             'results')
+    args = parser.parse_args()
+
+    diagnostics = PerformanceDiagnostics(workers=args.workers,
+                                         fast_yaml=args.fast_yaml)
+    if not diagnostics.docs_dir.is_dir():
+        print(f'Error: docs directory not found: {diagnostics.docs_dir}',
+              file=sys.stderr)
+        sys.exit(1)
+    selected = args.phases.split(',') if args.phases else None
+    try:
+        diagnostics.run_full_diagnostics(selected, json_output=args.json)
+    except ValueError as exc:
+        print(f'Error: {exc}', file=sys.stderr)
+        sys.exit(2)
+
+
+if __name__ == '__main__':
+    main()
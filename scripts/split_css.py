@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Split the monolithic legacy stylesheet into per-module CSS files.
+
+The pre-refactor style.css groups rules under
+`/* ==================== Section ==================== */` banner
+comments. This tool slices those sections out of the backup copy and
+regroups them into module files, which is how the modular layout under
+docs/css/ was originally produced. Kept for reference and for
+re-splitting if the backup is ever revised.
+
+Usage:
+    python scripts/split_css.py [--input docs/css/style.css.backup]
+"""
+
+import argparse
+import mmap
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+try:                     # optional: linear-time DFA scan of the banners
+    import hyperscan
+except ImportError:      # pragma: no cover - optional dependency
+    hyperscan = None
+
+
+def _banner(title):
+    # banners are pure ASCII, so markers are bytes and matching happens
+    # on the raw mapping without decoding the file
+    return f'/* ==================== {title} ==================== */'.encode()
+
+
+filter_start_markers = [
+    _banner('Filter Control Bar'),
+    _banner('Chip Buttons'),
+    _banner('Filter Dropdown Overlay'),
+    _banner('Filter Options (Chips)'),
+    _banner('Filter Tooltip'),
+]
+
+css_modules = {
+    'filter.css': filter_start_markers,
+    'video.css': [
+        _banner('Video Grid & Toolbar'),
+        _banner('Video Panel'),
+        _banner('Video Card'),
+        _banner('Video Thumbnail'),
+        _banner('Video Info'),
+        _banner('Video Hover Overlay'),
+        _banner('Download Button'),
+    ],
+    'selection.css': [
+        _banner('Selection Panel'),
+        _banner('Selection List'),
+        _banner('Selection Item'),
+        _banner('Selection Footer'),
+        _banner('Empty Cart Hint'),
+        _banner('Hub Switch Button'),
+    ],
+    'components.css': [
+        _banner('Loading Overlay'),
+        _banner('Detail Modal'),
+        _banner('Hover Preview Card'),
+        _banner('Toast Notification'),
+    ],
+    'animations.css': [
+        _banner('CSS Animations'),
+    ],
+}
+
+# All section banners in the legacy stylesheet match this one shape.
+_BANNER_PATTERN = rb'/\* ={4,} [^*]*? ={4,} \*/'
+BANNER_RE = re.compile(_BANNER_PATTERN)
+
+
+def _find_banners(content):
+    """Yield every (start, banner_bytes) in one pass over `content`.
+
+    With hyperscan installed the sweep runs in a C-level DFA (linear
+    time, no backtracking); otherwise the compiled Python regex does
+    the same single pass. Either way callers see identical tuples.
+    """
+    if hyperscan is not None:
+        try:
+            db = hyperscan.Database()
+            db.compile(expressions=[_BANNER_PATTERN],
+                       flags=[hyperscan.HS_FLAG_SOM_LEFTMOST])
+            spans = {}
+
+            def on_match(_id, start, end, _flags, _ctx):
+                # keep the longest match per start offset
+                if end > spans.get(start, 0):
+                    spans[start] = end
+
+            db.scan(bytes(content), match_event_handler=on_match)
+            return [(start, bytes(content[start:end]))
+                    for start, end in sorted(spans.items())]
+        except hyperscan.error:
+            pass  # malformed db/scan: fall through to the regex sweep
+    return [(m.start(), m.group(0)) for m in BANNER_RE.finditer(content)]
+
+
+def build_section_table(content):
+    """Map banner text -> (start, end) offsets in one pass.
+
+    The stylesheet is a linear sequence of banners, so a single
+    finditer yields every section boundary in O(N); the per-marker
+    DOTALL searches this replaces each rescanned the file from offset
+    0, O(K*N) across K markers with backtracking on top.
+    """
+    banners = _find_banners(content)
+    table = {}
+    for i, (start, text) in enumerate(banners):
+        end = banners[i + 1][0] if i + 1 < len(banners) else len(content)
+        table[text] = (start, end)
+    return table
+
+
+def extract_section(content, marker, table):
+    """Return the section starting at `marker`, up to the next banner."""
+    bounds = table.get(marker)
+    if bounds is None:
+        return b''
+    return content[bounds[0]:bounds[1]].rstrip(b'\n')
+
+
+def split_css(content, output_dir):
+    """Write one file per module, concatenating its extracted sections."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    table = build_section_table(content)
+
+    # Assemble every module first (one join per module, no growing
+    # buffer), then write all of them concurrently: each worker sits in
+    # the GIL-releasing write(2), so the five independent files cost one
+    # round trip to disk instead of five sequential ones.
+    modules = []
+    for module_name, markers in css_modules.items():
+        parts = [f'/* {module_name} — extracted from legacy '
+                 'style.css */\n\n'.encode()]
+        found = 0
+        for marker in markers:
+            section = extract_section(content, marker, table)
+            if section:
+                found += 1
+                parts.append(section)
+                parts.append(b'\n\n')
+        modules.append((module_name, found, len(markers), b''.join(parts)))
+
+    with ThreadPoolExecutor(max_workers=len(modules)) as pool:
+        futures = [
+            pool.submit((output_dir / name).write_bytes, data)
+            for name, _, _, data in modules
+        ]
+        for (name, found, total, _), future in zip(modules, futures):
+            written = future.result()
+            print(f'✓ {name}: {found}/{total} sections, {written} bytes')
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Split the legacy monolithic stylesheet into modules')
+    parser.add_argument('--input', default='docs/css/style.css.backup',
+                        help='monolithic stylesheet to split')
+    parser.add_argument('--output-dir', default='docs/css/generated',
+                        help='directory receiving the module files')
+    args = parser.parse_args()
+
+    input_path = Path(args.input)
+    try:
+        # map the file read-only: the banner scan runs over the raw
+        # bytes and only the emitted slices ever touch Python memory
+        with open(input_path, 'rb') as fh, \
+                mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            split_css(mm, Path(args.output_dir))
+    except (OSError, ValueError):
+        print(f'Error: cannot read input stylesheet: {input_path}',
+              file=sys.stderr)
+        return 1
+
+    print('Split complete.')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())